@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 import os
 from pathlib import Path
 
+_TRUTHY_VALUES = frozenset({"1", "true", "yes", "on"})
 
+
+@functools.cache
 def _load_local_env_file() -> None:
     env_path = Path(__file__).resolve().parent.parent / ".env"
     if not env_path.exists():
@@ -12,10 +16,12 @@ def _load_local_env_file() -> None:
 
     for raw_line in env_path.read_text(encoding="utf-8").splitlines():
         line = raw_line.strip()
-        if not line or line.startswith("#") or "=" not in line:
+        if not line or line.startswith("#"):
             continue
 
-        key, value = line.split("=", 1)
+        key, separator, value = line.partition("=")
+        if not separator:
+            continue
         normalized_key = key.strip()
         normalized_value = value.strip().strip('"').strip("'")
         os.environ.setdefault(normalized_key, normalized_value)
@@ -25,7 +31,7 @@ def _read_bool(name: str, default: bool) -> bool:
     value = os.getenv(name)
     if value is None:
         return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    return value.strip().lower() in _TRUTHY_VALUES
 
 
 def _read_int(name: str, default: int) -> int:
@@ -53,6 +59,7 @@ class Settings:
     obd_host: str
     obd_port: int
     poll_interval: float
+    command_timeout: float
     reconnect_delay: float
     http_host: str
     http_port: int
@@ -65,6 +72,7 @@ def load_settings() -> Settings:
         obd_host=os.getenv("OBD_HOST", "192.168.0.10"),
         obd_port=_read_int("OBD_PORT", 35000),
         poll_interval=_read_float("POLL_INTERVAL", 0.40),
+        command_timeout=_read_float("COMMAND_TIMEOUT", 1.0),
         reconnect_delay=_read_float("RECONNECT_DELAY", 3.0),
         http_host=os.getenv("HTTP_HOST", "0.0.0.0"),
         http_port=_read_int("HTTP_PORT", 8080),
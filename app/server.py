@@ -5,7 +5,7 @@ from contextlib import suppress
 from pathlib import Path
 
 from fastapi import FastAPI
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from .config import load_settings
@@ -28,8 +28,8 @@ async def root() -> FileResponse:
 
 
 @app.get("/api/state")
-async def api_state() -> dict[str, object]:
-    return await store.snapshot()
+async def api_state() -> Response:
+    return Response(content=store.snapshot_json(), media_type="application/json")
 
 
 @app.get("/api/health")
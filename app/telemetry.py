@@ -1,41 +1,74 @@
 from __future__ import annotations
 
 import asyncio
-import copy
 from dataclasses import dataclass
-from datetime import datetime, timezone
+import functools
 import logging
 import math
 import random
 import re
-from typing import Callable
+import time
+
+import orjson
 
 from .config import Settings
 
 LOGGER = logging.getLogger(__name__)
 
 
+_iso_second_prefix: tuple[int, str] = (-1, "")
+
+
 def utc_now_iso() -> str:
-    return datetime.now(tz=timezone.utc).isoformat()
+    global _iso_second_prefix
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _iso_second_prefix
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _iso_second_prefix = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}+00:00"
 
 
 @dataclass(frozen=True)
 class PIDDefinition:
     command: str
     bytes_needed: int
-    decoder: Callable[[list[int]], float]
+    scale: float
+    offset: float = 0.0
 
 
 PID_TABLE: dict[str, PIDDefinition] = {
-    "rpm": PIDDefinition("010C", 2, lambda d: ((d[0] * 256) + d[1]) / 4.0),
-    "speed_kmh": PIDDefinition("010D", 1, lambda d: float(d[0])),
-    "coolant_c": PIDDefinition("0105", 1, lambda d: float(d[0] - 40)),
-    "throttle_pct": PIDDefinition("0111", 1, lambda d: (d[0] * 100.0) / 255.0),
-    "engine_load_pct": PIDDefinition("0104", 1, lambda d: (d[0] * 100.0) / 255.0),
-    "fuel_level_pct": PIDDefinition("012F", 1, lambda d: (d[0] * 100.0) / 255.0),
-    "intake_c": PIDDefinition("010F", 1, lambda d: float(d[0] - 40)),
+    "rpm": PIDDefinition("010C", 2, 0.25),
+    "speed_kmh": PIDDefinition("010D", 1, 1.0),
+    "coolant_c": PIDDefinition("0105", 1, 1.0, -40.0),
+    "throttle_pct": PIDDefinition("0111", 1, 100.0 / 255.0),
+    "engine_load_pct": PIDDefinition("0104", 1, 100.0 / 255.0),
+    "fuel_level_pct": PIDDefinition("012F", 1, 100.0 / 255.0),
+    "intake_c": PIDDefinition("010F", 1, 1.0, -40.0),
 }
 
+MAX_PIDS_PER_REQUEST = 6
+MULTI_PID_RETRY_CYCLES = 100
+
+
+def _build_pid_batches() -> list[tuple[str, tuple[str, ...]]]:
+    keys_by_mode: dict[str, list[str]] = {}
+    for key, definition in PID_TABLE.items():
+        keys_by_mode.setdefault(definition.command[:2].upper(), []).append(key)
+
+    batches: list[tuple[str, tuple[str, ...]]] = []
+    for mode, keys in keys_by_mode.items():
+        for start in range(0, len(keys), MAX_PIDS_PER_REQUEST):
+            chunk = tuple(keys[start : start + MAX_PIDS_PER_REQUEST])
+            command = mode + "".join(PID_TABLE[key].command[2:4].upper() for key in chunk)
+            batches.append((command, chunk))
+    return batches
+
+
+PID_BATCHES = _build_pid_batches()
+_PID_SIZES = {definition.command.upper(): definition.bytes_needed for definition in PID_TABLE.values()}
+
 CONTROL_LINES = {
     "OK",
     "NO DATA",
@@ -45,29 +78,41 @@ CONTROL_LINES = {
     "ERROR",
     "?",
 }
-HEX_LINE_RE = re.compile(r"^[0-9A-F ]+$")
+_HEX_LINE_DELETE = str.maketrans("", "", "0123456789ABCDEF ")
 VOLT_RE = re.compile(r"(\d{1,2}(?:[.,]\d{1,2})?)")
 
 
 class TelemetryStore:
     def __init__(self, adapter_host: str, adapter_port: int) -> None:
-        self._lock = asyncio.Lock()
-        self._snapshot: dict[str, object] = {
-            "connected": False,
-            "updated_at": None,
-            "last_error": None,
-            "adapter": {
-                "host": adapter_host,
-                "port": adapter_port,
-            },
-            "metrics": {key: None for key in PID_TABLE} | {"battery_v": None},
-        }
+        self._snapshot: dict[str, object] = {}
+        self._snapshot_json = b""
+        self._publish(
+            {
+                "connected": False,
+                "updated_at": None,
+                "last_error": None,
+                "adapter": {
+                    "host": adapter_host,
+                    "port": adapter_port,
+                },
+                "metrics": {key: None for key in PID_TABLE} | {"battery_v": None},
+            }
+        )
+        self._metric_keys = frozenset(PID_TABLE) | {"battery_v"}
+
+    def _publish(self, state: dict[str, object]) -> None:
+        self._snapshot = state
+        self._snapshot_json = orjson.dumps(state)
 
     async def set_connected(self, connected: bool, last_error: str | None = None) -> None:
-        async with self._lock:
-            self._snapshot["connected"] = connected
-            self._snapshot["last_error"] = last_error
-            self._snapshot["updated_at"] = utc_now_iso()
+        self._publish(
+            {
+                **self._snapshot,
+                "connected": connected,
+                "last_error": last_error,
+                "updated_at": utc_now_iso(),
+            }
+        )
 
     async def update_metrics(
         self,
@@ -75,19 +120,39 @@ class TelemetryStore:
         connected: bool = True,
         last_error: str | None = None,
     ) -> None:
-        async with self._lock:
-            metric_store = self._snapshot["metrics"]
-            assert isinstance(metric_store, dict)
-            for key, value in metrics.items():
-                if key in metric_store:
-                    metric_store[key] = value
-            self._snapshot["connected"] = connected
-            self._snapshot["last_error"] = last_error
-            self._snapshot["updated_at"] = utc_now_iso()
+        if metrics.keys() <= self._metric_keys:
+            accepted = metrics
+        else:
+            accepted = {key: value for key, value in metrics.items() if key in self._metric_keys}
+
+        current = self._snapshot
+        metric_store = current["metrics"]
+        assert isinstance(metric_store, dict)
+        new_metrics = {**metric_store, **accepted}
+        self._publish(
+            {
+                **current,
+                "metrics": new_metrics,
+                "connected": connected,
+                "last_error": last_error,
+                "updated_at": utc_now_iso(),
+            }
+        )
 
     async def snapshot(self) -> dict[str, object]:
-        async with self._lock:
-            return copy.deepcopy(self._snapshot)
+        state = self._snapshot
+        adapter = state["adapter"]
+        metrics = state["metrics"]
+        assert isinstance(adapter, dict) and isinstance(metrics, dict)
+        return {**state, "adapter": dict(adapter), "metrics": dict(metrics)}
+
+    def snapshot_json(self) -> bytes:
+        return self._snapshot_json
+
+
+@functools.cache
+def _command_bytes(command: str) -> bytes:
+    return f"{command}\r".encode("ascii")
 
 
 class ELM327Client:
@@ -115,19 +180,40 @@ class ELM327Client:
         self._writer = None
 
     async def send(self, command: str) -> str:
+        responses = await self.send_many([command])
+        return responses[0]
+
+    async def send_many(self, commands: list[str], command_timeout: float | None = None) -> list[str]:
+        if self._writer is None:
+            raise ConnectionError("OBD adapter socket is not connected.")
+
+        responses: list[str] = []
+        for command in commands:
+            self._writer.write(_command_bytes(command))
+            await self._writer.drain()
+            try:
+                responses.append(await self._read_until_prompt(command_timeout))
+            except asyncio.TimeoutError:
+                if command_timeout is None:
+                    raise
+                LOGGER.debug("OBD command %s timed out after %.2fs", command, command_timeout)
+                await self._interrupt()
+                responses.append("")
+        return responses
+
+    async def _interrupt(self) -> None:
         if self._writer is None:
             raise ConnectionError("OBD adapter socket is not connected.")
 
-        payload = f"{command}\r".encode("ascii")
-        self._writer.write(payload)
+        # Any byte aborts a pending request; an idle ELM327 ignores a space, unlike a bare CR.
+        self._writer.write(b" ")
         await self._writer.drain()
-        return await self._read_until_prompt()
+        await self._read_until_prompt()
 
     async def _initialize_adapter(self) -> None:
-        setup_commands = ("ATZ", "ATE0", "ATL0", "ATS0", "ATH0", "ATSP0")
+        setup_commands = ("ATZ", "ATE0", "ATL0", "ATS0", "ATH0", "ATSP0", "0100")
         for cmd in setup_commands:
             await self.send(cmd)
-            await asyncio.sleep(0.05)
 
     async def _synchronize_prompt(self) -> None:
         if self._writer is None:
@@ -142,54 +228,140 @@ class ELM327Client:
             except Exception:
                 return
 
-    async def _read_until_prompt(self) -> str:
+    async def _read_until_prompt(self, timeout: float | None = None) -> str:
         if self._reader is None:
             raise ConnectionError("OBD adapter socket is not connected.")
 
-        chunks: list[str] = []
-        while True:
-            raw = await asyncio.wait_for(self._reader.read(256), timeout=self._timeout)
-            if not raw:
-                raise ConnectionError("OBD adapter closed the socket.")
-            text = raw.decode("ascii", errors="ignore")
-            chunks.append(text)
-            if ">" in text:
-                break
-        return "".join(chunks)
+        try:
+            raw = await asyncio.wait_for(
+                self._reader.readuntil(b">"),
+                timeout=self._timeout if timeout is None else timeout,
+            )
+        except asyncio.IncompleteReadError as exc:
+            raise ConnectionError("OBD adapter closed the socket.") from exc
+        except asyncio.LimitOverrunError as exc:
+            raise ConnectionError("OBD adapter sent an oversized reply without a prompt.") from exc
+        return raw.decode("ascii", errors="ignore")
 
 
-def _split_hex_pairs(value: str) -> list[str]:
-    compact = value.replace(" ", "")
-    if len(compact) % 2 != 0:
-        return []
-    return [compact[i : i + 2] for i in range(0, len(compact), 2)]
+def _hex_line_bytes(line: str) -> bytes | None:
+    try:
+        return bytes.fromhex(line)
+    except ValueError:
+        return None
 
 
-def parse_pid_bytes(command: str, response: str) -> list[int] | None:
-    expected_mode = f"{int(command[:2], 16) + 0x40:02X}"
-    expected_pid = command[2:4].upper()
+@functools.cache
+def _response_header(command: str) -> tuple[str, int, int]:
     command_upper = command.upper()
+    return command_upper, int(command_upper[:2], 16) + 0x40, int(command_upper[2:4], 16)
 
-    for raw_line in response.replace("\r", "\n").split("\n"):
+
+@functools.cache
+def _batch_header(command: str) -> tuple[str, int, dict[int, tuple[str, int]]]:
+    command_upper = command.upper()
+    mode = command_upper[:2]
+    requested: dict[int, tuple[str, int]] = {}
+    for i in range(2, len(command_upper), 2):
+        pid_command = mode + command_upper[i : i + 2]
+        size = _PID_SIZES.get(pid_command)
+        if size is not None:
+            requested[int(pid_command[2:], 16)] = (pid_command, size)
+    return command_upper, int(mode, 16) + 0x40, requested
+
+
+def parse_pid_bytes(command: str, response: str) -> bytes | None:
+    command_upper, expected_mode, expected_pid = _response_header(command)
+
+    for raw_line in response.splitlines():
         line = raw_line.strip().upper().replace(">", "")
         if not line or line == command_upper or line.startswith("SEARCHING"):
             continue
         if line in CONTROL_LINES:
             continue
-        if not HEX_LINE_RE.fullmatch(line):
+        if line.translate(_HEX_LINE_DELETE):
             continue
 
-        tokens = line.split() if " " in line else _split_hex_pairs(line)
-        if len(tokens) < 2:
+        raw = _hex_line_bytes(line)
+        if raw is None or len(raw) < 2:
             continue
-        if tokens[0] != expected_mode or tokens[1] != expected_pid:
+        if raw[0] != expected_mode or raw[1] != expected_pid:
             continue
+        return raw[2:]
+    return None
 
-        try:
-            return [int(token, 16) for token in tokens[2:]]
-        except ValueError:
+
+def _split_responses(command_upper: str, response: str) -> list[tuple[int | None, bytearray]]:
+    responses: list[tuple[int | None, bytearray]] = []
+    current: bytearray | None = None
+    next_frame = 0
+    for raw_line in response.splitlines():
+        line = raw_line.strip().upper().replace(">", "")
+        if not line or line == command_upper or line.startswith("SEARCHING"):
             continue
-    return None
+        if line in CONTROL_LINES:
+            continue
+
+        index, separator, frame = line.partition(":")
+        if separator:
+            try:
+                frame_index = int(index, 16)
+            except ValueError:
+                continue
+            if frame_index == 0 and (current is None or next_frame != 0):
+                current = bytearray()
+                responses.append((None, current))
+            if current is None or frame_index != next_frame:
+                continue
+            raw = _hex_line_bytes(frame.strip())
+            if raw is not None:
+                current += raw
+                next_frame = (next_frame + 1) % 16
+            continue
+
+        if line.translate(_HEX_LINE_DELETE):
+            continue
+        raw = _hex_line_bytes(line)
+        if raw is not None:
+            responses.append((None, bytearray(raw)))
+            current = None
+        elif len(line) == 3:
+            current = bytearray()
+            responses.append((int(line, 16), current))
+            next_frame = 0
+    return responses
+
+
+def parse_multi_pid_bytes(command: str, response: str) -> dict[str, bytes]:
+    command_upper, expected_mode, requested = _batch_header(command)
+
+    payloads: dict[str, bytes] = {}
+    for byte_count, data in _split_responses(command_upper, response):
+        if byte_count is not None:
+            del data[byte_count:]
+        if not data or data[0] != expected_mode:
+            continue
+
+        index = 1
+        while index < len(data):
+            entry = requested.get(data[index])
+            if entry is None:
+                break
+            pid_command, size = entry
+            if index + 1 + size > len(data):
+                break
+            payloads.setdefault(pid_command, bytes(data[index + 1 : index + 1 + size]))
+            index += 1 + size
+    return payloads
+
+
+def multi_pid_rejected(command: str, response: str, payloads: dict[str, bytes]) -> bool:
+    if any(line.strip().replace(">", "") == "?" for line in response.splitlines()):
+        return True
+    command_upper = command.upper()
+    if len(command_upper) <= 4:
+        return False
+    return payloads.keys() == {command_upper[:4]}
 
 
 def parse_voltage(response: str) -> float | None:
@@ -232,19 +404,45 @@ class TelemetryPoller:
                 await client.connect()
                 await self._store.set_connected(True, None)
 
+                cycle = 0
+                multi_pid_resume_cycle = 0
                 while not stop_event.is_set():
-                    metrics: dict[str, float | None] = {}
-                    for key, definition in PID_TABLE.items():
-                        response = await client.send(definition.command)
-                        payload = parse_pid_bytes(definition.command, response)
-                        if payload is None or len(payload) < definition.bytes_needed:
-                            metrics[key] = None
-                            continue
+                    cycle += 1
+                    batched = cycle >= multi_pid_resume_cycle
+                    batch_commands = [command for command, _ in PID_BATCHES] if batched else []
+                    *batch_responses, voltage_response = await client.send_many(
+                        [*batch_commands, "ATRV"], self._settings.command_timeout
+                    )
 
-                        raw_value = definition.decoder(payload[: definition.bytes_needed])
-                        metrics[key] = round(raw_value, 1)
+                    metrics: dict[str, float | None] = {}
+                    for index, (command, keys) in enumerate(PID_BATCHES):
+                        if batched:
+                            response = batch_responses[index]
+                            payloads = parse_multi_pid_bytes(command, response)
+                            rejected = multi_pid_rejected(command, response, payloads)
+                            probe = len(keys) > 1 and bool(response)
+                        else:
+                            payloads = {}
+                            rejected = False
+                            probe = True
+                        missing = tuple(key for key in keys if PID_TABLE[key].command not in payloads)
+                        if probe and missing:
+                            single_payloads = await self._read_single_pids(client, missing)
+                            payloads = {**payloads, **single_payloads}
+                            if batched and (rejected or single_payloads):
+                                LOGGER.debug("Adapter rejected multi-PID request %s", command)
+                                multi_pid_resume_cycle = cycle + MULTI_PID_RETRY_CYCLES
+
+                        for key in keys:
+                            definition = PID_TABLE[key]
+                            payload = payloads.get(definition.command)
+                            if payload is None or len(payload) < definition.bytes_needed:
+                                metrics[key] = None
+                                continue
+
+                            raw = int.from_bytes(payload[: definition.bytes_needed], "big")
+                            metrics[key] = round(raw * definition.scale + definition.offset, 1)
 
-                    voltage_response = await client.send("ATRV")
                     voltage_value = parse_voltage(voltage_response)
                     metrics["battery_v"] = round(voltage_value, 2) if voltage_value is not None else None
 
@@ -257,6 +455,16 @@ class TelemetryPoller:
             finally:
                 await client.close()
 
+    async def _read_single_pids(self, client: ELM327Client, keys: tuple[str, ...]) -> dict[str, bytes]:
+        commands = [PID_TABLE[key].command for key in keys]
+        payloads: dict[str, bytes] = {}
+        responses = await client.send_many(commands, self._settings.command_timeout)
+        for command, response in zip(commands, responses):
+            payload = parse_pid_bytes(command, response)
+            if payload is not None:
+                payloads[command] = payload
+        return payloads
+
     async def _run_simulation(self, stop_event: asyncio.Event) -> None:
         await self._store.set_connected(True, None)
         t = 0.0
@@ -55,6 +55,7 @@ if [[ ! -f "${PROJECT_DIR}/.env" ]]; then
 OBD_HOST=192.168.0.10
 OBD_PORT=35000
 POLL_INTERVAL=0.40
+COMMAND_TIMEOUT=1.0
 RECONNECT_DELAY=3.0
 HTTP_HOST=0.0.0.0
 HTTP_PORT=8080
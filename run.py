@@ -1,25 +1,72 @@
 from __future__ import annotations
 
 import logging
+import logging.config
+import logging.handlers
+import queue
 
-import uvicorn
 
-from app.config import load_settings
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
-def configure_logging() -> None:
+def _is_uvicorn(record: logging.LogRecord) -> bool:
+    return record.name.partition(".")[0] == "uvicorn"
+
+
+def _is_uvicorn_access(record: logging.LogRecord) -> bool:
+    return record.name == "uvicorn.access"
+
+
+def configure_logging(uvicorn_log_config: dict[str, object]) -> logging.handlers.QueueListener:
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
+    logging.config.dictConfig(uvicorn_log_config)
 
+    root_logger = logging.getLogger()
+    uvicorn_logger = logging.getLogger("uvicorn")
+    access_logger = logging.getLogger("uvicorn.access")
+    (root_handler,) = root_logger.handlers
+    (uvicorn_handler,) = uvicorn_logger.handlers
+    (access_handler,) = access_logger.handlers
+    root_handler.addFilter(lambda record: not _is_uvicorn(record))
+    uvicorn_handler.addFilter(lambda record: _is_uvicorn(record) and not _is_uvicorn_access(record))
+    access_handler.addFilter(_is_uvicorn_access)
 
-if __name__ == "__main__":
-    configure_logging()
-    settings = load_settings()
-    uvicorn.run(
-        "app.server:app",
-        host=settings.http_host,
-        port=settings.http_port,
-        log_level="info",
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = _RecordQueueHandler(log_queue)
+    for logger in (root_logger, uvicorn_logger, access_logger):
+        logger.handlers = [queue_handler]
+
+    listener = logging.handlers.QueueListener(
+        log_queue, root_handler, uvicorn_handler, access_handler, respect_handler_level=True
     )
+    listener.start()
+    return listener
+
+
+def main() -> None:
+    import uvicorn
+    from uvicorn.config import LOGGING_CONFIG
+
+    from app.config import load_settings
+
+    listener = configure_logging(LOGGING_CONFIG)
+    settings = load_settings()
+    try:
+        uvicorn.run(
+            "app.server:app",
+            host=settings.http_host,
+            port=settings.http_port,
+            log_level="info",
+            log_config=None,
+        )
+    finally:
+        listener.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,38 +3,26 @@ const view = {
     updatedAt: document.getElementById("updated-at"),
     adapterInfo: document.getElementById("adapter-info"),
     errorInfo: document.getElementById("error-info"),
-    speed: document.getElementById("speed-value"),
-    rpm: document.getElementById("rpm-value"),
-    coolant: document.getElementById("coolant-value"),
-    intake: document.getElementById("intake-value"),
-    throttle: document.getElementById("throttle-value"),
-    load: document.getElementById("load-value"),
-    fuel: document.getElementById("fuel-value"),
-    battery: document.getElementById("battery-value"),
-    bars: {
-        speed: document.getElementById("speed-bar"),
-        rpm: document.getElementById("rpm-bar"),
-        coolant: document.getElementById("coolant-bar"),
-        intake: document.getElementById("intake-bar"),
-        throttle: document.getElementById("throttle-bar"),
-        load: document.getElementById("load-bar"),
-        fuel: document.getElementById("fuel-bar"),
-        battery: document.getElementById("battery-bar"),
-    },
 };
 
-const limits = {
-    speed_kmh: 220,
-    rpm: 7000,
-    coolant_c: 120,
-    intake_c: 80,
-    throttle_pct: 100,
-    engine_load_pct: 100,
-    fuel_level_pct: 100,
-    battery_v: 16,
-};
+const gauges = [
+    { metric: "speed_kmh", id: "speed", max: 220, digits: 0 },
+    { metric: "rpm", id: "rpm", max: 7000, digits: 0 },
+    { metric: "coolant_c", id: "coolant", max: 120, digits: 0 },
+    { metric: "intake_c", id: "intake", max: 80, digits: 0 },
+    { metric: "throttle_pct", id: "throttle", max: 100, digits: 0 },
+    { metric: "engine_load_pct", id: "load", max: 100, digits: 0 },
+    { metric: "fuel_level_pct", id: "fuel", max: 100, digits: 0 },
+    { metric: "battery_v", id: "battery", max: 16, digits: 2 },
+].map((gauge) => ({
+    ...gauge,
+    value: document.getElementById(`${gauge.id}-value`),
+    bar: document.getElementById(`${gauge.id}-bar`),
+}));
 
 let requestInFlight = false;
+let renderedUpdatedAt = null;
+const barTransforms = new WeakMap();
 
 function formatValue(value, digits = 0) {
     if (value === null || value === undefined || Number.isNaN(Number(value))) {
@@ -43,16 +31,27 @@ function formatValue(value, digits = 0) {
     return Number(value).toFixed(digits);
 }
 
+function setText(element, text) {
+    if (element.textContent !== text) {
+        element.textContent = text;
+    }
+}
+
 function setBar(element, value, max) {
-    if (!element || value === null || value === undefined || Number.isNaN(Number(value))) {
-        if (element) {
-            element.style.width = "0%";
-        }
+    if (!element) {
         return;
     }
 
-    const ratio = Math.max(0, Math.min(1, Number(value) / max));
-    element.style.width = `${(ratio * 100).toFixed(1)}%`;
+    let transform = "scaleX(0)";
+    if (value !== null && value !== undefined && !Number.isNaN(Number(value))) {
+        const ratio = Math.max(0, Math.min(1, Number(value) / max));
+        transform = `scaleX(${ratio.toFixed(3)})`;
+    }
+
+    if (barTransforms.get(element) !== transform) {
+        barTransforms.set(element, transform);
+        element.style.transform = transform;
+    }
 }
 
 function formatTimestamp(isoValue) {
@@ -70,6 +69,9 @@ function formatTimestamp(isoValue) {
 }
 
 function setConnectionState(connected) {
+    if (view.pill.classList.contains(connected ? "online" : "offline")) {
+        return;
+    }
     if (connected) {
         view.pill.textContent = "Online";
         view.pill.classList.remove("offline");
@@ -87,35 +89,24 @@ function renderSnapshot(snapshot) {
     const connected = Boolean(snapshot.connected);
 
     setConnectionState(connected);
-    view.updatedAt.textContent = formatTimestamp(snapshot.updated_at);
+    setText(view.updatedAt, formatTimestamp(snapshot.updated_at));
 
     const adapter = snapshot.adapter || {};
-    view.adapterInfo.textContent = `Adapter: ${adapter.host || "-"}:${adapter.port || "-"}`;
-    view.errorInfo.textContent = snapshot.last_error
-        ? `Error: ${snapshot.last_error}`
-        : "Status: data stream active";
-
-    view.speed.textContent = formatValue(metrics.speed_kmh, 0);
-    view.rpm.textContent = formatValue(metrics.rpm, 0);
-    view.coolant.textContent = formatValue(metrics.coolant_c, 0);
-    view.intake.textContent = formatValue(metrics.intake_c, 0);
-    view.throttle.textContent = formatValue(metrics.throttle_pct, 0);
-    view.load.textContent = formatValue(metrics.engine_load_pct, 0);
-    view.fuel.textContent = formatValue(metrics.fuel_level_pct, 0);
-    view.battery.textContent = formatValue(metrics.battery_v, 2);
-
-    setBar(view.bars.speed, metrics.speed_kmh, limits.speed_kmh);
-    setBar(view.bars.rpm, metrics.rpm, limits.rpm);
-    setBar(view.bars.coolant, metrics.coolant_c, limits.coolant_c);
-    setBar(view.bars.intake, metrics.intake_c, limits.intake_c);
-    setBar(view.bars.throttle, metrics.throttle_pct, limits.throttle_pct);
-    setBar(view.bars.load, metrics.engine_load_pct, limits.engine_load_pct);
-    setBar(view.bars.fuel, metrics.fuel_level_pct, limits.fuel_level_pct);
-    setBar(view.bars.battery, metrics.battery_v, limits.battery_v);
+    setText(view.adapterInfo, `Adapter: ${adapter.host || "-"}:${adapter.port || "-"}`);
+    setText(
+        view.errorInfo,
+        snapshot.last_error ? `Error: ${snapshot.last_error}` : "Status: data stream active",
+    );
+
+    for (const gauge of gauges) {
+        const value = metrics[gauge.metric];
+        setText(gauge.value, formatValue(value, gauge.digits));
+        setBar(gauge.bar, value, gauge.max);
+    }
 }
 
 async function tick() {
-    if (requestInFlight) {
+    if (requestInFlight || document.hidden) {
         return;
     }
     requestInFlight = true;
@@ -126,15 +117,25 @@ async function tick() {
             throw new Error(`HTTP ${response.status}`);
         }
         const snapshot = await response.json();
-        renderSnapshot(snapshot);
+        if (snapshot.updated_at === null || snapshot.updated_at !== renderedUpdatedAt) {
+            renderSnapshot(snapshot);
+            renderedUpdatedAt = snapshot.updated_at;
+        }
     } catch (error) {
+        renderedUpdatedAt = null;
         setConnectionState(false);
-        view.updatedAt.textContent = "No connection to server";
-        view.errorInfo.textContent = `Error: ${error.message}`;
+        setText(view.updatedAt, "No connection to server");
+        setText(view.errorInfo, `Error: ${error.message}`);
     } finally {
         requestInFlight = false;
     }
 }
 
+document.addEventListener("visibilitychange", () => {
+    if (!document.hidden) {
+        tick();
+    }
+});
+
 tick();
 setInterval(tick, 450);
@@ -0,0 +1,75 @@
+import pytest
+
+from app.telemetry import multi_pid_rejected, parse_multi_pid_bytes, parse_pid_bytes
+
+BATCH = "010C0D0511042F"
+FULL = {
+    "010C": b"\x0b\xb8",
+    "010D": b"\x32",
+    "0105": b"\x7b",
+    "0111": b"\xff",
+    "0104": b"\x40",
+    "012F": b"\x80",
+}
+WITHOUT_FUEL = {key: value for key, value in FULL.items() if key != "012F"}
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        ("410C0BB80D32\r\r>", {"010C": b"\x0b\xb8", "010D": b"\x32"}),
+        ("41 0C 0B B8 0D 32\r\r>", {"010C": b"\x0b\xb8", "010D": b"\x32"}),
+        ("00E\r0:410C0BB80D32\r1:057B11FF04402F\r2:80000000000000\r\r>", FULL),
+        ("00E\r0: 41 0C 0B B8 0D 32\r1: 05 7B 11 FF 04 40 2F\r2: 80 00 00 00 00 00 00\r\r>", FULL),
+        ("0:410C0BB80D32\r1:057B11FF04402F\r2:80000000000000\r\r>", FULL),
+        ("00C\r0:410C0BB80D32\r1:057B11FF04402F\r2:80000000000000\r\r>", WITHOUT_FUEL),
+        (
+            "410D3C0575\r00E\r0:410C0BB80D32\r1:057B11FF04402F\r2:80000000000000\r\r>",
+            {**FULL, "010D": b"\x3c", "0105": b"\x75"},
+        ),
+        (
+            "00E\r0:410C0BB80D32\r1:057B11FF04402F\r2:80000000000000\r410D3C0575\r\r>",
+            FULL,
+        ),
+        (f"{BATCH}\rSEARCHING...\r410C0BB80D32\r\r>", {"010C": b"\x0b\xb8", "010D": b"\x32"}),
+        ("410C0B\r\r>", {}),
+        ("?\r\r>", {}),
+        ("NO DATA\r\r>", {}),
+        ("7F 01 12\r\r>", {}),
+        ("", {}),
+    ],
+)
+def test_parse_multi_pid_bytes(response: str, expected: dict[str, bytes]) -> None:
+    assert parse_multi_pid_bytes(BATCH, response) == expected
+
+
+@pytest.mark.parametrize(
+    ("command", "response", "rejected"),
+    [
+        (BATCH, "?\r\r>", True),
+        (BATCH, "410C0BB8\r\r>", True),
+        (BATCH, "410C0BB80D32\r\r>", False),
+        (BATCH, "NO DATA\r\r>", False),
+        (BATCH, "7F0112\r\r>", False),
+        (BATCH, "", False),
+        ("010F", "410F45\r\r>", False),
+        ("010F", "?\r\r>", True),
+    ],
+)
+def test_multi_pid_rejected(command: str, response: str, rejected: bool) -> None:
+    payloads = parse_multi_pid_bytes(command, response)
+    assert multi_pid_rejected(command, response, payloads) is rejected
+
+
+@pytest.mark.parametrize(
+    ("command", "response", "expected"),
+    [
+        ("010C", "410C0BB8\r\r>", b"\x0b\xb8"),
+        ("010C", "010C\r41 0C 0B B8\r\r>", b"\x0b\xb8"),
+        ("010C", "410D32\r410C0BB8\r\r>", b"\x0b\xb8"),
+        ("010C", "NO DATA\r\r>", None),
+        ("010C", "7F0112\r\r>", None),
+    ],
+)
+def test_parse_pid_bytes(command: str, response: str, expected: bytes | None) -> None:
+    assert parse_pid_bytes(command, response) == expected